@@ -13,6 +13,8 @@ import java.util.logging.Logger;
 import jcarbon.JCarbon;
 import jcarbon.JCarbonReport;
 import jcarbon.cpu.eflect.ProcessEnergy;
+import jcarbon.cpu.eflect.TaskEnergy;
+import jcarbon.data.TimeOperations;
 import jcarbon.emissions.EmissionsInterval;
 
 public final class JCarbonUtil {
@@ -34,8 +36,34 @@ public final class JCarbonUtil {
       logger.info(String.format("rejecting negative period (%d) for new JCarbon", periodMillis));
       return new JCarbon(DEFAULT_PERIOD_MS);
     }
-    logger.info(String.format("creating JCarbon with period of %d milliseconds", periodMillis));
-    return new JCarbon(periodMillis);
+    int maxPeriodMillis = getMaxPeriodMillis(periodMillis);
+    logger.info(
+        String.format(
+            "creating JCarbon with period of %d to %d milliseconds",
+            periodMillis, maxPeriodMillis));
+    return new JCarbon(periodMillis, maxPeriodMillis);
+  }
+
+  /** Reads the longest period JCarbon may stretch to, defaulting to a fixed {@code period}. */
+  private static int getMaxPeriodMillis(int periodMillis) {
+    String maxPeriod =
+        System.getProperty("jcarbon.benchmarks.max_period", Integer.toString(periodMillis));
+    int maxPeriodMillis = periodMillis;
+    try {
+      maxPeriodMillis = Integer.parseInt(maxPeriod);
+    } catch (Exception e) {
+      logger.log(
+          Level.INFO, String.format("ignoring bad max period (%s) for new JCarbon", maxPeriod), e);
+      return periodMillis;
+    }
+    if (maxPeriodMillis < periodMillis) {
+      logger.info(
+          String.format(
+              "rejecting max period (%d) below the period (%d) for new JCarbon",
+              maxPeriodMillis, periodMillis));
+      return periodMillis;
+    }
+    return maxPeriodMillis;
   }
 
   public static Path outputPath() {
@@ -47,12 +75,21 @@ public final class JCarbonUtil {
 
   public static void summary(JCarbonReport report) {
     List<ProcessEnergy> processEnergy = report.getSignal(ProcessEnergy.class);
-    double energy =
-        processEnergy.stream()
-            .mapToDouble(nrg -> nrg.data().stream().mapToDouble(e -> e.energy).sum())
-            .sum();
-    Instant start = processEnergy.stream().map(ProcessEnergy::start).min(Instant::compareTo).get();
-    Instant end = processEnergy.stream().map(ProcessEnergy::end).max(Instant::compareTo).get();
+    if (processEnergy.isEmpty()) {
+      logger.info("no process energy to summarize");
+      return;
+    }
+    // grab everything in a single pass over the energy
+    double energy = 0;
+    Instant start = Instant.MAX;
+    Instant end = Instant.MIN;
+    for (ProcessEnergy nrg : processEnergy) {
+      for (TaskEnergy task : nrg.data()) {
+        energy += task.energy;
+      }
+      start = TimeOperations.min(start, nrg.start());
+      end = TimeOperations.max(end, nrg.end());
+    }
     logger.info("JCarbon report summary:");
     logger.info(
         String.format(" - %.4f seconds", (double) Duration.between(start, end).toMillis() / 1000));
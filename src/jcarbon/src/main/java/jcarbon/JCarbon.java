@@ -1,13 +1,15 @@
 package jcarbon;
 
-import static java.util.stream.Collectors.toList;
 import static jcarbon.data.DataOperations.forwardApply;
 import static jcarbon.data.DataOperations.forwardPartialAlign;
 
+import java.util.ArrayList;
 import java.util.List;
 import java.util.Optional;
 import java.util.concurrent.Executors;
 import java.util.concurrent.ScheduledExecutorService;
+import java.util.function.Supplier;
+import java.util.logging.Level;
 import java.util.logging.Logger;
 import jcarbon.cpu.eflect.EflectAccounting;
 import jcarbon.cpu.eflect.ProcessEnergy;
@@ -28,98 +30,146 @@ import jcarbon.emissions.EmissionsInterval;
 import jcarbon.util.LoggerUtil;
 import jcarbon.util.SamplingFuture;
 
-/** A class to collect and provide jcarbon signals. */
+/**
+ * A class to collect and provide jcarbon signals. All instances share a single sampling thread, so
+ * concurrently running instances take turns; slow reads by one delay the samples of the others.
+ */
 public final class JCarbon {
   private static final Logger logger = LoggerUtil.getLogger();
 
-  private final ScheduledExecutorService executor =
+  // these are shared by all instances so that each one doesn't spin up its own sampling thread
+  private static final ScheduledExecutorService EXECUTOR =
       Executors.newSingleThreadScheduledExecutor(
           r -> {
             Thread t = new Thread(r, "jcarbon-sampling-thread");
             t.setDaemon(true);
             return t;
           });
-  private final RaplSource source = RaplSource.getRaplSource();
-  private final EmissionsConverter converter = EmissionsConverters.forDefaultLocale();
+  private static final RaplSource SOURCE = RaplSource.getRaplSource();
+  private static final EmissionsConverter CONVERTER = EmissionsConverters.forDefaultLocale();
+
   private final int periodMillis;
+  private final int maxPeriodMillis;
 
   private boolean isRunning = false;
-  private SamplingFuture<ProcessSample> processFuture;
-  private SamplingFuture<SystemSample> systemFuture;
-  private SamplingFuture<Optional<RaplSample>> raplFuture;
+  private SamplingFuture<JCarbonSample> samplingFuture;
 
   public JCarbon(int periodMillis) {
+    this(periodMillis, periodMillis);
+  }
+
+  /**
+   * Creates a {@link JCarbon} that samples at {@code periodMillis}, but is allowed to back off to
+   * {@code maxPeriodMillis} if sampling becomes too expensive (i.e. many tasks).
+   */
+  public JCarbon(int periodMillis, int maxPeriodMillis) {
     this.periodMillis = periodMillis;
+    this.maxPeriodMillis = maxPeriodMillis;
   }
 
-  /** Starts the sampling futures is we aren't already running. */
+  /** Starts the sampling future if we aren't already running. */
   public void start() {
     synchronized (this) {
       if (!isRunning) {
-        processFuture =
-            SamplingFuture.fixedPeriodMillis(ProcTask::sampleTasks, periodMillis, executor);
-        systemFuture =
-            SamplingFuture.fixedPeriodMillis(ProcStat::sampleCpus, periodMillis, executor);
-        raplFuture = SamplingFuture.fixedPeriodMillis(source::sample, periodMillis, executor);
+        // all sources are read in one collection so there is one scheduled task per period
+        if (maxPeriodMillis > periodMillis) {
+          samplingFuture =
+              SamplingFuture.adaptivePeriodMillis(
+                  this::sample, periodMillis, maxPeriodMillis, EXECUTOR);
+        } else {
+          samplingFuture = SamplingFuture.fixedPeriodMillis(this::sample, periodMillis, EXECUTOR);
+        }
         isRunning = true;
       }
     }
   }
 
   /**
-   * Stops the sampling futures and merges the data they collected into a {@link JCarbonReport}.
+   * Stops the sampling future and merges the data it collected into a {@link JCarbonReport}.
    * Returns an empty {@link Optional} if jcarbon wasn't running.
    */
-  // TODO: this can throw if any of the futures are empty. i don't know how to handle this yet
   public Optional<JCarbonReport> stop() {
     synchronized (this) {
       if (isRunning) {
         isRunning = false;
 
+        List<JCarbonSample> samples = samplingFuture.get();
+        ArrayList<ProcessSample> processSamples = new ArrayList<>(samples.size());
+        ArrayList<SystemSample> systemSamples = new ArrayList<>(samples.size());
+        ArrayList<RaplSample> raplSamples = new ArrayList<>(samples.size());
+        for (JCarbonSample sample : samples) {
+          sample.process.ifPresent(processSamples::add);
+          sample.system.ifPresent(systemSamples::add);
+          sample.rapl.ifPresent(raplSamples::add);
+        }
+
         JCarbonReport report = new JCarbonReport();
 
-        // physical signals
-        report.addSignal(
-            ProcessJiffies.class, forwardApply(processFuture.get(), ProcessJiffies::between));
-        report.addSignal(
-            SystemJiffies.class, forwardApply(systemFuture.get(), SystemJiffies::between));
-        List<RaplSample> raplSamples =
-            raplFuture.get().stream()
-                .filter(Optional::isPresent)
-                .map(Optional::get)
-                .collect(toList());
+        // physical signals; we hold onto what we add since getSignal returns a copy
+        List<ProcessJiffies> processJiffies = forwardApply(processSamples, ProcessJiffies::between);
+        report.addSignal(ProcessJiffies.class, processJiffies);
+        List<SystemJiffies> systemJiffies = forwardApply(systemSamples, SystemJiffies::between);
+        report.addSignal(SystemJiffies.class, systemJiffies);
+        List<RaplEnergy> raplEnergy = List.of();
         if (raplSamples.size() > 1) {
-          report.addSignal(RaplEnergy.class, forwardApply(raplSamples, source::difference));
+          raplEnergy = forwardApply(raplSamples, SOURCE::difference);
+          report.addSignal(RaplEnergy.class, raplEnergy);
         } else {
           logger.info("no samples found for rapl");
         }
-        processFuture = null;
-        systemFuture = null;
-        raplFuture = null;
+        samplingFuture = null;
 
         // virtual signals
-        report.addSignal(
-            ProcessActivity.class,
+        List<ProcessActivity> processActivity =
             forwardPartialAlign(
-                report.getSignal(ProcessJiffies.class),
-                report.getSignal(SystemJiffies.class),
-                JiffiesAccounting::computeTaskActivity));
-        if (report.hasSignal(RaplEnergy.class)) {
-          report.addSignal(
-              ProcessEnergy.class,
-              forwardPartialAlign(
-                  report.getSignal(ProcessActivity.class),
-                  report.getSignal(RaplEnergy.class),
-                  EflectAccounting::computeTaskEnergy));
-          report.addSignal(
-              EmissionsInterval.class,
-              report.getSignal(ProcessEnergy.class).stream()
-                  .map(nrg -> converter.convert(nrg))
-                  .collect(toList()));
+                processJiffies, systemJiffies, JiffiesAccounting::computeTaskActivity);
+        report.addSignal(ProcessActivity.class, processActivity);
+        if (!raplEnergy.isEmpty()) {
+          List<ProcessEnergy> processEnergy =
+              forwardPartialAlign(processActivity, raplEnergy, EflectAccounting::computeTaskEnergy);
+          report.addSignal(ProcessEnergy.class, processEnergy);
+          ArrayList<EmissionsInterval> emissions = new ArrayList<>(processEnergy.size());
+          for (ProcessEnergy nrg : processEnergy) {
+            emissions.add(CONVERTER.convert(nrg));
+          }
+          report.addSignal(EmissionsInterval.class, emissions);
         }
         return Optional.of(report);
       }
     }
     return Optional.empty();
   }
+
+  private JCarbonSample sample() {
+    return new JCarbonSample(
+        sampleSafely("process jiffies", ProcTask::sampleTasks),
+        sampleSafely("system jiffies", ProcStat::sampleCpus),
+        sampleSafely("rapl", SOURCE::sample).flatMap(rapl -> rapl));
+  }
+
+  /** Reads from a source, dropping only this source's sample if it fails. */
+  private static <T> Optional<T> sampleSafely(String name, Supplier<T> source) {
+    try {
+      return Optional.ofNullable(source.get());
+    } catch (Exception e) {
+      logger.log(Level.WARNING, String.format("unable to sample %s: %s", name, e), e);
+      return Optional.empty();
+    }
+  }
+
+  /** The physical signals read in a single collection. */
+  private static final class JCarbonSample {
+    private final Optional<ProcessSample> process;
+    private final Optional<SystemSample> system;
+    private final Optional<RaplSample> rapl;
+
+    private JCarbonSample(
+        Optional<ProcessSample> process,
+        Optional<SystemSample> system,
+        Optional<RaplSample> rapl) {
+      this.process = process;
+      this.system = system;
+      this.rapl = rapl;
+    }
+  }
 }
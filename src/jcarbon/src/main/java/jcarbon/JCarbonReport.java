@@ -1,6 +1,5 @@
 package jcarbon;
 
-import static java.util.stream.Collectors.joining;
 import static jcarbon.util.LoggerUtil.getLogger;
 
 import java.util.ArrayList;
@@ -17,7 +16,7 @@ public final class JCarbonReport {
 
   /** Checks if there is a signal for the class. */
   public boolean hasSignal(Class<?> cls) {
-    return dataSignals.keySet().stream().anyMatch(cls::equals);
+    return dataSignals.containsKey(cls);
   }
 
   /** Shallow copy of the signals added. */
@@ -42,16 +41,26 @@ public final class JCarbonReport {
 
   @Override
   public String toString() {
-    return String.format(
-        "{%s}",
-        dataSignals.entrySet().stream()
-            .map(
-                e ->
-                    String.format(
-                        "\"%s\":[%s]",
-                        e.getKey().getSimpleName(),
-                        e.getValue().stream().map(Object::toString).collect(joining(","))))
-            .collect(joining(",")));
+    // Write everything into one buffer instead of formatting and joining each signal.
+    StringBuilder builder = new StringBuilder("{");
+    boolean firstSignal = true;
+    for (Map.Entry<Class<?>, List<?>> entry : dataSignals.entrySet()) {
+      if (!firstSignal) {
+        builder.append(',');
+      }
+      firstSignal = false;
+      builder.append('"').append(entry.getKey().getSimpleName()).append("\":[");
+      boolean firstData = true;
+      for (Object data : entry.getValue()) {
+        if (!firstData) {
+          builder.append(',');
+        }
+        firstData = false;
+        builder.append(data);
+      }
+      builder.append(']');
+    }
+    return builder.append('}').toString();
   }
 
   /** Type-checked way of adding data. */
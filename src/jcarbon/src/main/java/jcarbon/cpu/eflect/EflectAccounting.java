@@ -5,10 +5,12 @@ import static jcarbon.cpu.CpuInfo.getCpuSocketMapping;
 import java.time.Duration;
 import java.time.Instant;
 import java.util.ArrayList;
+import java.util.List;
 import java.util.Optional;
 import jcarbon.cpu.jiffies.ProcessActivity;
 import jcarbon.cpu.jiffies.TaskActivity;
 import jcarbon.cpu.rapl.RaplEnergy;
+import jcarbon.cpu.rapl.RaplReading;
 import jcarbon.data.TimeOperations;
 
 /** Class to compute the energy consumption of tasks based on fractional consumption. */
@@ -21,7 +23,8 @@ public final class EflectAccounting {
    */
   public static Optional<ProcessEnergy> computeTaskEnergy(
       ProcessActivity task, RaplEnergy energy) {
-    if (energy.data().length == 0) {
+    RaplReading[] readings = energy.data();
+    if (readings.length == 0) {
       return Optional.empty();
     }
 
@@ -32,13 +35,21 @@ public final class EflectAccounting {
         TimeOperations.divide(
             Duration.between(start, end), Duration.between(energy.start(), energy.end()));
 
-    ArrayList<TaskEnergy> tasks = new ArrayList<>();
-    double[] totalActivity = new double[energy.data().length];
+    List<TaskActivity> activities = task.data();
+    ArrayList<TaskEnergy> tasks = new ArrayList<>(activities.size());
+    double[] totalActivity = new double[readings.length];
     // Set this up for the conversation to sockets.
-    for (TaskActivity activity : task.data()) {
+    for (TaskActivity activity : activities) {
       totalActivity[SOCKETS_MAP[activity.cpu]] += activity.activity;
     }
-    for (TaskActivity activity : task.data()) {
+    // Compute the energy per unit of activity for each socket so each task is a single multiply.
+    double[] socketEnergy = new double[readings.length];
+    for (int socket = 0; socket < socketEnergy.length; socket++) {
+      if (totalActivity[socket] > 0) {
+        socketEnergy[socket] = readings[socket].total * intervalFraction / totalActivity[socket];
+      }
+    }
+    for (TaskActivity activity : activities) {
       // Don't bother if there is no activity.
       if (activity.activity == 0) {
         continue;
@@ -46,16 +57,12 @@ public final class EflectAccounting {
 
       int socket = SOCKETS_MAP[activity.cpu];
       // Don't bother if there is no energy.
-      if (energy.data()[socket].total == 0) {
+      if (socketEnergy[socket] == 0) {
         continue;
       }
 
       // Attribute a fraction of the total energy to the task based on its activity on the socket.
-      double taskEnergy =
-          energy.data()[socket].total
-              * intervalFraction
-              * activity.activity
-              / totalActivity[socket];
+      double taskEnergy = socketEnergy[socket] * activity.activity;
       tasks.add(new TaskEnergy(activity.taskId, activity.processId, activity.cpu, taskEnergy));
     }
     if (!tasks.isEmpty()) {
@@ -13,20 +13,27 @@ import java.util.Optional;
 public final class CpuFreq {
   private static final int CPU_COUNT = Runtime.getRuntime().availableProcessors();
   private static final Path SYS_CPU = Paths.get("/sys", "devices", "system", "cpu");
+  private static final String FREQUENCY = "cpuinfo_cur_freq";
+  private static final String OBSERVED_FREQUENCY = "scaling_cur_freq";
+  private static final String GOVERNOR = "scaling_governor";
+  // the paths are fixed, so build them once instead of on every read
+  private static final Path[] FREQUENCY_PATHS = getComponentPaths(FREQUENCY);
+  private static final Path[] OBSERVED_FREQUENCY_PATHS = getComponentPaths(OBSERVED_FREQUENCY);
+  private static final Path[] GOVERNOR_PATHS = getComponentPaths(GOVERNOR);
 
   /** Returns the expected frequency in KHz of a cpu. */
   public static int getFrequency(int cpu) {
-    return readCounter(cpu, "cpuinfo_cur_freq");
+    return readCounter(getComponentPath(FREQUENCY_PATHS, cpu, FREQUENCY));
   }
 
   /** Returns the observed frequency in KHz of a cpu. */
   public static int getObservedFrequency(int cpu) {
-    return readCounter(cpu, "scaling_cur_freq");
+    return readCounter(getComponentPath(OBSERVED_FREQUENCY_PATHS, cpu, OBSERVED_FREQUENCY));
   }
 
   /** Returns the current governor of a cpu. */
   public static String getGovernor(int cpu) {
-    return readFromComponent(cpu, "scaling_governor");
+    return readFromComponent(getComponentPath(GOVERNOR_PATHS, cpu, GOVERNOR));
   }
 
   public static Optional<CpuFrequencySample> sample() {
@@ -39,23 +46,39 @@ public final class CpuFreq {
     return Optional.of(new CpuFrequencySample(timestamp, readings));
   }
 
-  private static int readCounter(int cpu, String component) {
-    String counter = readFromComponent(cpu, component);
-    if (counter.isBlank()) {
+  private static int readCounter(Path component) {
+    String counter = readFromComponent(component).trim();
+    if (counter.isEmpty()) {
       return 0;
     }
     return Integer.parseInt(counter);
   }
 
-  private static synchronized String readFromComponent(int cpu, String component) {
+  private static synchronized String readFromComponent(Path component) {
     try {
-      return Files.readString(getComponentPath(cpu, component));
+      return Files.readString(component);
     } catch (Exception e) {
       // e.printStackTrace();
       return "";
     }
   }
 
+  private static Path[] getComponentPaths(String component) {
+    Path[] paths = new Path[CPU_COUNT];
+    for (int cpu = 0; cpu < CPU_COUNT; cpu++) {
+      paths[cpu] = getComponentPath(cpu, component);
+    }
+    return paths;
+  }
+
+  /** Returns the prebuilt path if we have one; cpu ids can exceed the available processors. */
+  private static Path getComponentPath(Path[] paths, int cpu, String component) {
+    if (0 <= cpu && cpu < paths.length) {
+      return paths[cpu];
+    }
+    return getComponentPath(cpu, component);
+  }
+
   private static Path getComponentPath(int cpu, String component) {
     return Paths.get(SYS_CPU.toString(), String.format("cpu%d", cpu), "cpufreq", component);
   }
@@ -1,6 +1,7 @@
 package jcarbon.cpu.jiffies;
 
 import java.util.ArrayList;
+import java.util.List;
 import java.util.Optional;
 import jcarbon.data.TimeOperations;
 
@@ -18,21 +19,26 @@ public final class JiffiesAccounting {
     if (proc.start().isAfter(sys.end()) || sys.start().isAfter(proc.end())) {
       return Optional.empty();
     }
-    ArrayList<TaskActivity> tasks = new ArrayList<>();
+    List<TaskJiffies> procJiffies = proc.data();
+    CpuJiffies[] sysJiffies = sys.data();
+    ArrayList<TaskActivity> tasks = new ArrayList<>(procJiffies.size());
     // Set this up to correct for kernel update.
-    int[] totalJiffies = new int[sys.data().length];
-    for (TaskJiffies reading : proc.data()) {
+    int[] totalJiffies = new int[sysJiffies.length];
+    for (TaskJiffies reading : procJiffies) {
       totalJiffies[reading.cpu] += reading.totalJiffies;
     }
-    for (TaskJiffies task : proc.data()) {
+    // Correct for the kernel update by using total jiffies reported by tasks if the cpu
+    // reported one is too small (this also catches zero jiffies reported by the cpu).
+    double[] cpuJiffies = new double[sysJiffies.length];
+    for (int cpu = 0; cpu < cpuJiffies.length; cpu++) {
+      cpuJiffies[cpu] = Math.max(sysJiffies[cpu].activeJiffies, totalJiffies[cpu]);
+    }
+    for (TaskJiffies task : procJiffies) {
       // Don't bother if there are no jiffies.
       if (task.totalJiffies == 0) {
         continue;
       }
-      // Correct for the kernel update by using total jiffies reported by tasks if the cpu
-      // reported one is too small (this also catches zero jiffies reported by the cpu).
-      double cpuJiffies = Math.max(sys.data()[task.cpu].activeJiffies, totalJiffies[task.cpu]);
-      double taskActivity = Math.min(1.0, task.totalJiffies / cpuJiffies);
+      double taskActivity = Math.min(1.0, task.totalJiffies / cpuJiffies[task.cpu]);
       tasks.add(new TaskActivity(task.taskId, task.processId, task.cpu, taskActivity));
     }
     // Don't bother if there is no activity.
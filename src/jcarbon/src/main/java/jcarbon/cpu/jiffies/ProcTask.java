@@ -42,13 +42,14 @@ public final class ProcTask {
 
   /** Reads stat files of tasks directory of a process. */
   private static final ArrayList<String> readTasks(long pid) {
-    ArrayList<String> stats = new ArrayList<String>();
     File tasks = new File(String.join(File.separator, "/proc", Long.toString(pid), "task"));
-    if (!tasks.exists()) {
-      return stats;
+    File[] taskDirs = tasks.listFiles();
+    if (taskDirs == null) {
+      return new ArrayList<>();
     }
 
-    for (File task : tasks.listFiles()) {
+    ArrayList<String> stats = new ArrayList<>(taskDirs.length);
+    for (File task : taskDirs) {
       File statFile = new File(task, "stat");
       if (!statFile.exists()) {
         continue;
@@ -57,8 +58,12 @@ public final class ProcTask {
       // TODO: using the traditional java method to support android
       try {
         BufferedReader reader = new BufferedReader(new FileReader(statFile));
-        stats.add(reader.readLine());
+        String stat = reader.readLine();
         reader.close();
+        // the task may have exited between listing and reading, which leaves the file empty
+        if (stat != null) {
+          stats.add(stat);
+        }
       } catch (Exception e) {
         System.out.println("unable to read task " + statFile + " before it terminated");
       }
@@ -67,8 +72,8 @@ public final class ProcTask {
   }
 
   /** Turns task stat strings into {@link TaskJiffiesReadings}. */
-  private static List<TaskJiffies> parseTasks(ArrayList<String> stats, long pid) {
-    ArrayList<TaskJiffies> readings = new ArrayList<>();
+  private static List<TaskJiffies> parseTasks(List<String> stats, long pid) {
+    ArrayList<TaskJiffies> readings = new ArrayList<>(stats.size());
     for (String s : stats) {
       String[] stat = s.split(" ");
       if (stat.length >= STAT_LENGTH) {
@@ -30,7 +30,7 @@ public final class ProcessJiffies
 
   private static List<TaskJiffies> difference(List<TaskJiffies> first, List<TaskJiffies> second) {
     Map<Long, TaskJiffies> secondMap = second.stream().collect(toMap(r -> r.taskId, r -> r));
-    ArrayList<TaskJiffies> jiffies = new ArrayList<>();
+    ArrayList<TaskJiffies> jiffies = new ArrayList<>(first.size());
     for (TaskJiffies task : first) {
       if (secondMap.containsKey(task.taskId)) {
         TaskJiffies other = secondMap.get(task.taskId);
@@ -2,13 +2,16 @@ package jcarbon.cpu.rapl;
 
 import static jcarbon.util.LoggerUtil.getLogger;
 
+import java.nio.ByteBuffer;
+import java.nio.channels.FileChannel;
+import java.nio.charset.StandardCharsets;
 import java.nio.file.Files;
 import java.nio.file.Path;
 import java.nio.file.Paths;
+import java.nio.file.StandardOpenOption;
 import java.time.Instant;
 import java.util.Optional;
 import java.util.logging.Logger;
-import java.util.stream.IntStream;
 
 /** Simple wrapper to read powercap's energy with pure Java. */
 // TODO: this doesn't appear to work on more modern implementations that are hierarchical
@@ -20,9 +23,16 @@ public final class Powercap {
 
   public static final int SOCKETS = getSocketCount();
 
+  // energy_uj is at most 20 digits and a newline
+  private static final int ENERGY_BUFFER_SIZE = 32;
+  // the energy files are kept open and re-read from the start instead of opened on every sample
+  private static final FileChannel[] PACKAGE_FILES = openFiles(getPackagePaths());
+  private static final FileChannel[] DRAM_FILES = openFiles(getDramPaths());
+  private static final boolean IS_AVAILABLE = anyOpen(PACKAGE_FILES) || anyOpen(DRAM_FILES);
+
   /** Returns whether we can read values. */
   public static boolean isAvailable() {
-    return SOCKETS > 0;
+    return IS_AVAILABLE;
   }
 
   /** Returns an {@link RaplSample} populated by parsing the string returned by {@ readNative}. */
@@ -58,12 +68,13 @@ public final class Powercap {
               "first sample is not before second sample (%s !< %s)",
               first.timestamp(), second.timestamp()));
     }
-    return new RaplEnergy(
-        first.timestamp(),
-        second.timestamp(),
-        IntStream.range(0, SOCKETS)
-            .mapToObj(socket -> difference(first.data()[socket], second.data()[socket]))
-            .toArray(RaplReading[]::new));
+    RaplReading[] firstReadings = first.data();
+    RaplReading[] secondReadings = second.data();
+    RaplReading[] readings = new RaplReading[SOCKETS];
+    for (int socket = 0; socket < SOCKETS; socket++) {
+      readings[socket] = difference(firstReadings[socket], secondReadings[socket]);
+    }
+    return new RaplEnergy(first.timestamp(), second.timestamp(), readings);
   }
 
   private static int getSocketCount() {
@@ -82,35 +93,82 @@ public final class Powercap {
     }
   }
 
+  /** Paths to /sys/devices/virtual/powercap/intel-rapl/intel-rapl:<socket>/energy_uj. */
+  private static Path[] getPackagePaths() {
+    Path[] paths = new Path[SOCKETS];
+    for (int socket = 0; socket < SOCKETS; socket++) {
+      String socketPrefix = String.format("intel-rapl:%d", socket);
+      paths[socket] = Paths.get(POWERCAP_ROOT.toString(), socketPrefix, "energy_uj");
+    }
+    return paths;
+  }
+
   /**
-   * Parses the contents of /sys/devices/virtual/powercap/intel-rapl/intel-rapl:<socket>/energy_uj,
-   * which contains the number of microjoules consumed by the package since boot as an integer.
+   * Paths to
+   * /sys/devices/virtual/powercap/intel-rapl/intel-rapl:<socket>/intel-rapl:<socket>:0/energy_uj.
    */
-  private static double readPackage(int socket) {
-    String socketPrefix = String.format("intel-rapl:%d", socket);
-    Path energyFile = Paths.get(POWERCAP_ROOT.toString(), socketPrefix, "energy_uj");
-    try {
-      return Double.parseDouble(Files.readString(energyFile)) / 1000000;
-    } catch (Exception e) {
-      return 0;
+  private static Path[] getDramPaths() {
+    Path[] paths = new Path[SOCKETS];
+    for (int socket = 0; socket < SOCKETS; socket++) {
+      String socketPrefix = String.format("intel-rapl:%d", socket);
+      paths[socket] =
+          Paths.get(
+              POWERCAP_ROOT.toString(),
+              socketPrefix,
+              String.format("%s:0", socketPrefix),
+              "energy_uj");
     }
+    return paths;
+  }
+
+  /**
+   * Parses the contents of the package's energy_uj, which contains the number of microjoules
+   * consumed by the package since boot as an integer.
+   */
+  private static double readPackage(int socket) {
+    return readEnergy(PACKAGE_FILES[socket]);
   }
 
   /**
-   * Parses the contents of
-   * /sys/devices/virtual/powercap/intel-rapl/intel-rapl:<socket>/intel-rapl:<socket>:0/energy_uj,
-   * which contains the number of microjoules consumed by the dram since boot as an integer.
+   * Parses the contents of the dram's energy_uj, which contains the number of microjoules consumed
+   * by the dram since boot as an integer.
    */
   private static double readDram(int socket) {
-    String socketPrefix = String.format("intel-rapl:%d", socket);
-    Path energyFile =
-        Paths.get(
-            POWERCAP_ROOT.toString(),
-            socketPrefix,
-            String.format("%s:0", socketPrefix),
-            "energy_uj");
+    return readEnergy(DRAM_FILES[socket]);
+  }
+
+  private static FileChannel[] openFiles(Path[] paths) {
+    FileChannel[] files = new FileChannel[paths.length];
+    for (int i = 0; i < paths.length; i++) {
+      try {
+        files[i] = FileChannel.open(paths[i], StandardOpenOption.READ);
+      } catch (Exception e) {
+        logger.warning(String.format("couldn't open %s; it will be reported as 0", paths[i]));
+      }
+    }
+    return files;
+  }
+
+  private static boolean anyOpen(FileChannel[] files) {
+    for (FileChannel file : files) {
+      if (file != null) {
+        return true;
+      }
+    }
+    return false;
+  }
+
+  private static double readEnergy(FileChannel energyFile) {
+    if (energyFile == null) {
+      return 0;
+    }
     try {
-      return Double.parseDouble(Files.readString(energyFile)) / 1000000;
+      // a positional read from the start makes sysfs produce a fresh value, so a single read
+      // replaces the open/read/close of reading the path
+      ByteBuffer buffer = ByteBuffer.allocate(ENERGY_BUFFER_SIZE);
+      energyFile.read(buffer, 0);
+      String energy = new String(buffer.array(), 0, buffer.position(), StandardCharsets.US_ASCII);
+      return (double) Long.parseLong(energy.trim()) / 1000000;
     } catch (Exception e) {
       return 0;
     }
@@ -7,7 +7,6 @@ import java.util.Arrays;
 import java.util.HashMap;
 import java.util.Optional;
 import java.util.logging.Logger;
-import java.util.stream.IntStream;
 
 /** Simple wrapper around rapl access that requires libjrapl.so. */
 public final class Rapl {
@@ -16,6 +15,11 @@ public final class Rapl {
   // the formatting issue associated with , vs . on certain locales
   private static final String ENERGY_STRING_DELIMITER = ";";
   private static final HashMap<String, Integer> COMPONENTS;
+  // offset of each component in a socket's entries, or -1 if it isn't available
+  private static final int PKG_INDEX;
+  private static final int DRAM_INDEX;
+  private static final int CORE_INDEX;
+  private static final int GPU_INDEX;
 
   private static final double WRAP_AROUND;
   private static final double DRAM_WRAP_AROUND;
@@ -45,37 +49,21 @@ public final class Rapl {
   }
 
   public static RaplSample readingToSample(double[] entries) {
-    // get the timestamp
-    long secs = (long) entries[entries.length - 1];
-    long nanos = (long) (1000000 * (entries[entries.length - 1] - (double) secs));
-    Instant timestamp = Instant.ofEpochSecond(secs, nanos);
+    // get the timestamp; the native timestamp is microsecond precision
+    long micros = Math.round(1000000 * entries[entries.length - 1]);
+    Instant timestamp = Instant.ofEpochSecond(micros / 1000000, 1000 * (micros % 1000000));
 
     // pull out energy values
     RaplReading[] readings = new RaplReading[MicroArchitecture.SOCKETS];
     for (int socket = 0; socket < MicroArchitecture.SOCKETS; socket++) {
-      // TODO: i was lazy, probably should use a builder or compress this somehow.
-      double pkg = 0;
-      double dram = 0;
-      double core = 0;
-      double gpu = 0;
-      for (String component : COMPONENTS.keySet()) {
-        double energy = entries[COMPONENTS.size() * socket + COMPONENTS.get(component)];
-        switch (component) {
-          case "pkg":
-            pkg = energy;
-            break;
-          case "dram":
-            dram = energy;
-            break;
-          case "core":
-            core = energy;
-            break;
-          case "gpu":
-            gpu = energy;
-            break;
-        }
-      }
-      readings[socket] = new RaplReading(socket, pkg, dram, core, gpu);
+      int offset = COMPONENTS.size() * socket;
+      readings[socket] =
+          new RaplReading(
+              socket,
+              getEnergy(entries, offset, PKG_INDEX),
+              getEnergy(entries, offset, DRAM_INDEX),
+              getEnergy(entries, offset, CORE_INDEX),
+              getEnergy(entries, offset, GPU_INDEX));
     }
 
     return new RaplSample(timestamp, readings);
@@ -113,12 +101,20 @@ public final class Rapl {
               "first sample is not before second sample (%s !< %s)",
               first.timestamp(), second.timestamp()));
     }
-    return new RaplEnergy(
-        first.timestamp(),
-        second.timestamp(),
-        IntStream.range(0, MicroArchitecture.SOCKETS)
-            .mapToObj(socket -> difference(first.data()[socket], second.data()[socket]))
-            .toArray(RaplReading[]::new));
+    RaplReading[] firstReadings = first.data();
+    RaplReading[] secondReadings = second.data();
+    RaplReading[] readings = new RaplReading[MicroArchitecture.SOCKETS];
+    for (int socket = 0; socket < MicroArchitecture.SOCKETS; socket++) {
+      readings[socket] = difference(firstReadings[socket], secondReadings[socket]);
+    }
+    return new RaplEnergy(first.timestamp(), second.timestamp(), readings);
+  }
+
+  private static double getEnergy(double[] entries, int offset, int index) {
+    if (index < 0) {
+      return 0;
+    }
+    return entries[offset + index];
   }
 
   private static double diffWithWraparound(double first, double second) {
@@ -174,6 +170,10 @@ public final class Rapl {
       DRAM_WRAP_AROUND = 0;
       COMPONENTS = new HashMap<>();
     }
+    PKG_INDEX = COMPONENTS.getOrDefault("pkg", -1);
+    DRAM_INDEX = COMPONENTS.getOrDefault("dram", -1);
+    CORE_INDEX = COMPONENTS.getOrDefault("core", -1);
+    GPU_INDEX = COMPONENTS.getOrDefault("gpu", -1);
   }
 
   private Rapl() {}
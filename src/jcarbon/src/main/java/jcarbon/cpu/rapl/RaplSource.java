@@ -76,11 +76,12 @@ public final class RaplSource {
               "first sample is not before second sample (%s !< %s)",
               first.timestamp(), second.timestamp()));
     }
-    return new RaplEnergy(
-        first.timestamp(),
-        second.timestamp(),
-        IntStream.range(0, SOCKETS)
-            .mapToObj(socket -> Powercap.difference(first.data()[socket], second.data()[socket]))
-            .toArray(RaplReading[]::new));
+    RaplReading[] firstReadings = first.data();
+    RaplReading[] secondReadings = second.data();
+    RaplReading[] readings = new RaplReading[SOCKETS];
+    for (int socket = 0; socket < SOCKETS; socket++) {
+      readings[socket] = Powercap.difference(firstReadings[socket], secondReadings[socket]);
+    }
+    return new RaplEnergy(first.timestamp(), second.timestamp(), readings);
   }
 }
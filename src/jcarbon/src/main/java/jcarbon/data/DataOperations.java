@@ -13,7 +13,7 @@ public final class DataOperations {
     if (data.size() < 2) {
       return List.of();
     }
-    ArrayList<U> diffs = new ArrayList<>();
+    ArrayList<U> diffs = new ArrayList<>(data.size() - 1);
     for (int i = 0; i < data.size() - 1; i++) {
       diffs.add(func.apply(data.get(i), data.get(i + 1)));
     }
@@ -29,6 +29,10 @@ public final class DataOperations {
   /** Attempts to apply a method between two {@link Interval} {@link Lists} along the time axis. */
   public static <T extends Interval<?>, U extends Interval<?>, V> List<V> forwardPartialAlign(
       List<T> firstData, List<U> secondData, BiFunction<T, U, Optional<V>> func) {
+    if (firstData.isEmpty() || secondData.isEmpty()) {
+      return List.of();
+    }
+
     Iterator<T> firstIt = firstData.iterator();
     T first = firstIt.next();
 
@@ -4,11 +4,9 @@ import static java.util.concurrent.TimeUnit.NANOSECONDS;
 import static java.util.stream.Collectors.toList;
 
 import java.time.Duration;
-import java.time.Instant;
 import java.util.ArrayList;
 import java.util.Collection;
 import java.util.List;
-import java.util.Optional;
 import java.util.concurrent.Executors;
 import java.util.concurrent.Future;
 import java.util.concurrent.ScheduledExecutorService;
@@ -47,6 +45,38 @@ public final class SamplingFuture<T> implements Future<List<T>> {
         source, () -> Duration.ofMillis(periodMillisSupplier.getAsInt()), executor);
   }
 
+  /**
+   * Start a {@link SamplingFuture} that samples no faster than {@code minPeriod}. If reading the
+   * source becomes expensive, the period is stretched (up to {@code maxPeriod}) so the source
+   * doesn't monopolize the executor.
+   */
+  public static <T> SamplingFuture<T> adaptivePeriod(
+      Supplier<? extends T> source,
+      Duration minPeriod,
+      Duration maxPeriod,
+      ScheduledExecutorService executor) {
+    AdaptivePeriod period = new AdaptivePeriod(minPeriod, maxPeriod);
+    return new SamplingFuture<T>(
+        () -> {
+          long start = System.nanoTime();
+          T data = source.get();
+          period.record(System.nanoTime() - start);
+          return data;
+        },
+        period,
+        executor);
+  }
+
+  /** Start a {@link SamplingFuture} that samples with an adaptive millisecond period. */
+  public static <T> SamplingFuture<T> adaptivePeriodMillis(
+      Supplier<? extends T> source,
+      int minPeriodMillis,
+      int maxPeriodMillis,
+      ScheduledExecutorService executor) {
+    return adaptivePeriod(
+        source, Duration.ofMillis(minPeriodMillis), Duration.ofMillis(maxPeriodMillis), executor);
+  }
+
   /** Reduces multiple sampling futures into a single list. */
   public static <T> List<T> flatten(Collection<SamplingFuture<T>> data) {
     return data.stream()
@@ -66,7 +96,10 @@ public final class SamplingFuture<T> implements Future<List<T>> {
 
   private final AtomicBoolean isCollecting = new AtomicBoolean(true);
   private final List<T> collectedData = new ArrayList<>();
-  private final List<Future<Optional<? extends T>>> dataFutures = new ArrayList<>();
+  // only the most recently scheduled collection is tracked; data is stored as it is produced
+  private Future<?> nextFuture;
+  // whether the collection behind nextFuture has begun; both are guarded by this
+  private boolean nextStarted = false;
 
   public SamplingFuture(
       Supplier<? extends T> source,
@@ -74,20 +107,20 @@ public final class SamplingFuture<T> implements Future<List<T>> {
       ScheduledExecutorService executor) {
     this.nextInterval = nextInterval;
     this.executor = executor;
-    synchronized (dataFutures) {
+    synchronized (this) {
       // TODO: there is a very strange failure case here. if the source throws an exception,
       // i can't catch it and it just get propagated to the caller of get
-      dataFutures.add(executor.submit(() -> collectDataAndReschedule(source)));
+      nextFuture = executor.submit(() -> collectDataAndReschedule(source));
     }
   }
 
-  /** Stops collecting data. If {@code mayInterruptIfRunning} is true, the data is extracted. */
+  /** Stops collecting data. If {@code mayInterruptIfRunning} is true, waits for the last sample. */
   @Override
   public boolean cancel(boolean mayInterruptIfRunning) {
     // this will kill all pending futures
     isCollecting.set(false);
     if (mayInterruptIfRunning) {
-      extractAllData();
+      waitForCollection();
     }
     return true;
   }
@@ -98,11 +131,13 @@ public final class SamplingFuture<T> implements Future<List<T>> {
     if (isCollecting.get()) {
       cancel(true);
     }
-    return collectedData;
+    synchronized (collectedData) {
+      return new ArrayList<>(collectedData);
+    }
   }
 
   /** Delegates to {@code get}. */
-  // TODO: some re-wiring of extractAllData is required to get this to work.
+  // TODO: some re-wiring of waitForCollection is required to get this to work.
   @Override
   public List<T> get(long timeout, TimeUnit unit) {
     return get();
@@ -117,76 +152,121 @@ public final class SamplingFuture<T> implements Future<List<T>> {
   /** Returns if data is still being collected. */
   @Override
   public boolean isDone() {
-    synchronized (dataFutures) {
-      return isCancelled() && dataFutures.stream().allMatch(Future::isDone);
+    synchronized (this) {
+      return isCancelled() && nextFuture.isDone();
     }
   }
 
   /**
-   * Collect from the {@link Supplier}, re-schedule for the next period start, and return the data.
+   * Collect from the {@link Supplier}, store the data, and re-schedule for the next period start.
    */
-  private Optional<? extends T> collectDataAndReschedule(Supplier<? extends T> source) {
-    if (isCancelled()) {
-      isCollecting.set(false);
-      return Optional.empty();
+  private void collectDataAndReschedule(Supplier<? extends T> source) {
+    synchronized (this) {
+      if (isCancelled()) {
+        isCollecting.set(false);
+        return;
+      }
+      nextStarted = true;
     }
 
     // TODO: need some sort of safety mechanism so this doesn't kill the chain on throw
-    Optional<? extends T> data = Optional.empty();
-    Instant start = Instant.now();
+    // use the monotonic clock; we only need the elapsed time here
+    long start = System.nanoTime();
     try {
-      data = Optional.of(source.get());
+      T data = source.get();
+      if (data != null) {
+        synchronized (collectedData) {
+          collectedData.add(data);
+        }
+      }
     } catch (Exception e) {
       // TODO: bad! we are throwing away the error
     }
-    Duration rescheduleTime = nextInterval.get().minus(Duration.between(start, Instant.now()));
+    long rescheduleNanos = nextInterval.get().toNanos() - (System.nanoTime() - start);
 
     if (!isCancelled()) {
-      synchronized (dataFutures) {
-        if (rescheduleTime.toNanos() > 0) {
+      synchronized (this) {
+        nextStarted = false;
+        if (rescheduleNanos > 0) {
           // if we have some extra time, schedule the next one in the future
-          dataFutures.add(
+          nextFuture =
               executor.schedule(
-                  () -> collectDataAndReschedule(source), rescheduleTime.toNanos(), NANOSECONDS));
+                  () -> collectDataAndReschedule(source), rescheduleNanos, NANOSECONDS);
         } else {
           // if we don't, run the next one immediately
-          dataFutures.add(executor.submit(() -> collectDataAndReschedule(source)));
+          nextFuture = executor.submit(() -> collectDataAndReschedule(source));
         }
       }
     }
-    return data;
   }
 
-  /** Wait until {@link Futures} in {@code dataFutures} are done, then extract all the data. */
-  private void extractAllData() {
-    // TODO: should i do this with lock.notify()?
-    while (!isDone()) {
-      try {
-        Thread.sleep(nextInterval.get().toMillis());
-      } catch (Exception e) {
-        e.printStackTrace();
+  /** Wait until the last scheduled collection is done, even if we are interrupted. */
+  private void waitForCollection() {
+    boolean interrupted = false;
+    while (true) {
+      Future<?> future;
+      synchronized (this) {
+        future = nextFuture;
+        // a collection that hasn't started yet will see that we stopped and skip collecting,
+        // so drop it instead of waiting for it to come up
+        if (!nextStarted) {
+          future.cancel(false);
+          break;
+        }
+      }
+      // otherwise block on the running collection directly rather than polling
+      while (true) {
+        try {
+          future.get();
+          break;
+        } catch (InterruptedException e) {
+          // returning now would hand back data while a collection is still running
+          interrupted = true;
+        } catch (Exception e) {
+          // the collection doesn't throw, so there is nothing to do here
+          break;
+        }
+      }
+      // the collection may have scheduled another one before it saw that we stopped
+      synchronized (this) {
+        if (future == nextFuture) {
+          break;
+        }
       }
     }
-    synchronized (collectedData) {
-      dataFutures.stream()
-          .map(this::extractValue)
-          .filter(Optional::isPresent)
-          .map(Optional::get)
-          .forEach(collectedData::add);
-      dataFutures.clear();
+    if (interrupted) {
+      Thread.currentThread().interrupt();
     }
   }
 
   /**
-   * Forcibly retrieve the value from a {@link Future}; if it can't be retrieved, then return an
-   * empty {@link Optional}.
+   * A period that tracks a moving average of the source's cost and scales the period so the source
+   * only takes up a fraction of it, bounded by a minimum and maximum period.
    */
-  private Optional<? extends T> extractValue(Future<Optional<? extends T>> future) {
-    try {
-      return future.get();
-    } catch (Exception e) {
-      System.out.println("could not consume a future");
+  static final class AdaptivePeriod implements Supplier<Duration> {
+    // weight of the newest measurement in the moving average
+    private static final double SMOOTHING = 0.2;
+    // the period should be at least this many times the cost of reading the source
+    static final long COST_FACTOR = 10;
+
+    private final long minPeriodNanos;
+    private final long maxPeriodNanos;
+
+    private volatile double averageCostNanos = 0;
+
+    AdaptivePeriod(Duration minPeriod, Duration maxPeriod) {
+      this.minPeriodNanos = minPeriod.toNanos();
+      this.maxPeriodNanos = Math.max(minPeriodNanos, maxPeriod.toNanos());
+    }
+
+    void record(long costNanos) {
+      averageCostNanos = SMOOTHING * costNanos + (1 - SMOOTHING) * averageCostNanos;
+    }
+
+    @Override
+    public Duration get() {
+      long periodNanos = COST_FACTOR * (long) averageCostNanos;
+      return Duration.ofNanos(Math.min(maxPeriodNanos, Math.max(minPeriodNanos, periodNanos)));
     }
-    return Optional.empty();
   }
 }
@@ -12,9 +12,11 @@ import org.junit.runners.JUnit4;
 @RunWith(JUnit4.class)
 public class JiffiesAccountingTest {
   private static final int CPU = 0;
+  private static final int OTHER_CPU = 1;
   private static final int PID = 1;
   private static final int TID_1 = 2;
   private static final int TID_2 = 3;
+  private static final int TID_3 = 4;
 
   private static final Instant ZERO = Instant.EPOCH;
   private static final Instant ONE = Instant.EPOCH.plusMillis(1);
@@ -99,6 +101,35 @@ public class JiffiesAccountingTest {
     assertEquals(0.75, activity.data().get(1).activity, 0.0);
   }
 
+  @Test
+  public void computeTaskActivity_multipleCpus() {
+    ProcessJiffies process =
+        new ProcessJiffies(
+            ZERO,
+            ONE,
+            PID,
+            List.of(
+                createTaskJiffies(TID_1, CPU, 1),
+                createTaskJiffies(TID_2, CPU, 2),
+                createTaskJiffies(TID_3, OTHER_CPU, 3)));
+    SystemJiffies system =
+        new SystemJiffies(
+            ZERO,
+            ONE,
+            new CpuJiffies[] {createCpuJiffies(CPU, 4), createCpuJiffies(OTHER_CPU, 2)});
+
+    ProcessActivity activity = JiffiesAccounting.computeTaskActivity(process, system).get();
+
+    assertEquals(3, activity.data().size());
+    assertEquals(TID_1, activity.data().get(0).taskId);
+    assertEquals(0.25, activity.data().get(0).activity, 0.0);
+    assertEquals(TID_2, activity.data().get(1).taskId);
+    assertEquals(0.50, activity.data().get(1).activity, 0.0);
+    assertEquals(TID_3, activity.data().get(2).taskId);
+    assertEquals(OTHER_CPU, activity.data().get(2).cpu);
+    assertEquals(1.0, activity.data().get(2).activity, 0.0);
+  }
+
   @Test
   public void computeTaskActivity_noOverlap() {
     ProcessJiffies process =
@@ -110,10 +141,18 @@ public class JiffiesAccountingTest {
   }
 
   private static TaskJiffies createTaskJiffies(int taskId, int jiffies) {
-    return new TaskJiffies(taskId, PID, CPU, jiffies, 0);
+    return createTaskJiffies(taskId, CPU, jiffies);
+  }
+
+  private static TaskJiffies createTaskJiffies(int taskId, int cpu, int jiffies) {
+    return new TaskJiffies(taskId, PID, cpu, jiffies, 0);
   }
 
   private static CpuJiffies createCpuJiffies(int jiffies) {
-    return new CpuJiffies(CPU, jiffies, 0, 0, 0, 0, 0, 0, 0, 0, 0);
+    return createCpuJiffies(CPU, jiffies);
+  }
+
+  private static CpuJiffies createCpuJiffies(int cpu, int jiffies) {
+    return new CpuJiffies(cpu, jiffies, 0, 0, 0, 0, 0, 0, 0, 0, 0);
   }
 }
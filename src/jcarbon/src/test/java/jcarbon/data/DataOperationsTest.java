@@ -56,6 +56,16 @@ public class DataOperationsTest {
     assertEquals(525, values.stream().mapToLong(i -> i.data()).sum());
   }
 
+  @Test
+  public void forwardAlign_empty() {
+    List<TestInterval> intervals =
+        List.of(new TestInterval(Instant.ofEpochMilli(0), Instant.ofEpochMilli(1), 1));
+    BiFunction<TestInterval, TestInterval, TestInterval> func = (i1, i2) -> i1;
+
+    assertEquals(0, DataOperations.forwardAlign(List.of(), intervals, func).size());
+    assertEquals(0, DataOperations.forwardAlign(intervals, List.of(), func).size());
+  }
+
   private static class TestInterval implements Interval<Long> {
     private final Instant start;
     private final Instant end;
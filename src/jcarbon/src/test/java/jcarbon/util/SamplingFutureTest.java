@@ -0,0 +1,158 @@
+package jcarbon.util;
+
+import static org.junit.Assert.assertEquals;
+import static org.junit.Assert.assertTrue;
+
+import java.time.Duration;
+import java.util.List;
+import java.util.concurrent.Executors;
+import java.util.concurrent.ScheduledExecutorService;
+import java.util.concurrent.atomic.AtomicInteger;
+import org.junit.After;
+import org.junit.Before;
+import org.junit.Test;
+import org.junit.runner.RunWith;
+import org.junit.runners.JUnit4;
+
+@RunWith(JUnit4.class)
+public class SamplingFutureTest {
+  private static final int PERIOD_MILLIS = 1;
+  private static final int COLLECTION_MILLIS = 50;
+  private static final int SLOW_SAMPLE_MILLIS = 20;
+
+  private ScheduledExecutorService executor;
+
+  @Before
+  public void setUp() {
+    executor = Executors.newSingleThreadScheduledExecutor();
+  }
+
+  @After
+  public void tearDown() {
+    executor.shutdownNow();
+  }
+
+  @Test
+  public void get_returnsEverySample() throws Exception {
+    AtomicInteger counter = new AtomicInteger(0);
+    SamplingFuture<Integer> future =
+        SamplingFuture.fixedPeriodMillis(counter::incrementAndGet, PERIOD_MILLIS, executor);
+
+    Thread.sleep(COLLECTION_MILLIS);
+    List<Integer> data = future.get();
+
+    assertTrue(data.size() > 1);
+    assertEquals(counter.get(), data.size());
+    for (int i = 0; i < data.size(); i++) {
+      assertEquals(i + 1, data.get(i).intValue());
+    }
+  }
+
+  @Test
+  public void get_stopsCollecting() throws Exception {
+    AtomicInteger counter = new AtomicInteger(0);
+    SamplingFuture<Integer> future =
+        SamplingFuture.fixedPeriodMillis(counter::incrementAndGet, PERIOD_MILLIS, executor);
+
+    Thread.sleep(COLLECTION_MILLIS);
+    int size = future.get().size();
+    Thread.sleep(COLLECTION_MILLIS);
+
+    assertTrue(future.isDone());
+    assertEquals(size, counter.get());
+    assertEquals(size, future.get().size());
+  }
+
+  @Test
+  public void get_waitsForCollectionWhenInterrupted() throws Exception {
+    AtomicInteger counter = new AtomicInteger(0);
+    SamplingFuture<Integer> future =
+        SamplingFuture.fixedPeriodMillis(
+            () -> {
+              try {
+                Thread.sleep(SLOW_SAMPLE_MILLIS);
+              } catch (InterruptedException e) {
+                Thread.currentThread().interrupt();
+              }
+              return counter.incrementAndGet();
+            },
+            PERIOD_MILLIS,
+            executor);
+
+    Thread.sleep(COLLECTION_MILLIS);
+    Thread.currentThread().interrupt();
+    List<Integer> data = future.get();
+
+    // the interrupt is kept for the caller
+    assertTrue(Thread.interrupted());
+    assertTrue(future.isDone());
+    assertEquals(counter.get(), data.size());
+
+    Thread.sleep(COLLECTION_MILLIS);
+
+    assertEquals(data.size(), counter.get());
+    assertEquals(data.size(), future.get().size());
+  }
+
+  @Test
+  public void get_continuesAfterSourceThrows() throws Exception {
+    AtomicInteger counter = new AtomicInteger(0);
+    SamplingFuture<Integer> future =
+        SamplingFuture.fixedPeriodMillis(
+            () -> {
+              int value = counter.incrementAndGet();
+              if (value % 2 == 1) {
+                throw new IllegalStateException("odd sample");
+              }
+              return value;
+            },
+            PERIOD_MILLIS,
+            executor);
+
+    Thread.sleep(COLLECTION_MILLIS);
+    List<Integer> data = future.get();
+
+    assertTrue(counter.get() > 2);
+    assertEquals(counter.get() / 2, data.size());
+    assertTrue(data.stream().allMatch(value -> value % 2 == 0));
+  }
+
+  @Test
+  public void adaptivePeriod_noCost() {
+    SamplingFuture.AdaptivePeriod period =
+        new SamplingFuture.AdaptivePeriod(Duration.ofMillis(1), Duration.ofMillis(100));
+
+    assertEquals(Duration.ofMillis(1), period.get());
+
+    period.record(0);
+
+    assertEquals(Duration.ofMillis(1), period.get());
+  }
+
+  @Test
+  public void adaptivePeriod_scalesWithCost() {
+    long costNanos = Duration.ofMillis(1).toNanos();
+    SamplingFuture.AdaptivePeriod period =
+        new SamplingFuture.AdaptivePeriod(Duration.ofMillis(1), Duration.ofMillis(100));
+
+    // the moving average converges on the cost
+    for (int i = 0; i < 100; i++) {
+      period.record(costNanos);
+    }
+
+    long expectedNanos = SamplingFuture.AdaptivePeriod.COST_FACTOR * costNanos;
+    assertEquals(expectedNanos, period.get().toNanos(), 0.01 * expectedNanos);
+  }
+
+  @Test
+  public void adaptivePeriod_cappedAtMax() {
+    SamplingFuture.AdaptivePeriod period =
+        new SamplingFuture.AdaptivePeriod(Duration.ofMillis(1), Duration.ofMillis(100));
+
+    for (int i = 0; i < 100; i++) {
+      period.record(Duration.ofSeconds(1).toNanos());
+    }
+
+    assertEquals(Duration.ofMillis(100), period.get());
+  }
+}